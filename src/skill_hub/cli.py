@@ -6,7 +6,6 @@ import click
 from rich.console import Console
 
 from skill_hub import __version__
-from skill_hub.web.app import create_app
 
 console = Console()
 
@@ -27,6 +26,9 @@ def web_command(port: int, host: str, no_open: bool) -> None:
     import time
     import webbrowser
 
+    # Flask, the scheduler and the repo modules are only needed by the web UI
+    from skill_hub.web.app import create_app
+
     app = create_app()
 
     def open_browser():
@@ -7,6 +7,12 @@ import yaml
 
 from skill_hub.models import SkillMetadata
 
+try:
+    # libyaml's C loader builds the same objects several times faster
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 class SkillParseError(Exception):
     """Error parsing skill file."""
@@ -14,6 +20,15 @@ class SkillParseError(Exception):
     pass
 
 
+# YAML frontmatter between --- delimiters, then the body
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
+
+def safe_load(stream):
+    """Like yaml.safe_load, but uses the C loader when PyYAML has libyaml."""
+    return yaml.load(stream, Loader=_SafeLoader)
+
+
 def parse_skill_file(content: str) -> Tuple[SkillMetadata, str]:
     """
     Parse SKILL.md file into metadata and content.
@@ -27,9 +42,7 @@ def parse_skill_file(content: str) -> Tuple[SkillMetadata, str]:
     Raises:
         SkillParseError: If frontmatter is missing or invalid
     """
-    # Match YAML frontmatter between --- delimiters
-    pattern = r"^---\s*\n(.*?)\n---\s*\n(.*)$"
-    match = re.match(pattern, content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
 
     if not match:
         raise SkillParseError("Missing or invalid YAML frontmatter")
@@ -38,7 +51,7 @@ def parse_skill_file(content: str) -> Tuple[SkillMetadata, str]:
     body = match.group(2)
 
     try:
-        frontmatter = yaml.safe_load(frontmatter_str)
+        frontmatter = safe_load(frontmatter_str)
     except yaml.YAMLError as e:
         raise SkillParseError(f"Invalid YAML: {e}") from e
 
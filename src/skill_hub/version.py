@@ -1,14 +1,18 @@
 """Version management module for skill-hub."""
 
 import re
+import time
 from typing import Optional, Tuple
 
 import requests
 
 
+_SEMVER_RE = re.compile(r"v?(\d+)\.(\d+)\.(\d+)")
+
+
 def parse_semver(version_str: str) -> Tuple[int, int, int]:
     """Parse a semantic version string into components."""
-    match = re.match(r"v?(\d+)\.(\d+)\.(\d+)", version_str)
+    match = _SEMVER_RE.match(version_str)
     if match:
         return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
     raise ValueError(f"Invalid semantic version: {version_str}")
@@ -51,3 +55,23 @@ def get_latest_version(repo_path: str, timeout: float = 10) -> Optional[str]:
         pass
 
     return None
+
+
+# Every page load asks for the latest version, and unauthenticated GitHub API
+# calls are limited to 60 an hour, so answers are reused for a while.
+# Failed lookups are retried sooner.
+LATEST_VERSION_TTL = 3600.0
+FAILED_LOOKUP_TTL = 300.0
+_latest_version_cache: dict[str, tuple[float, Optional[str]]] = {}
+
+
+def get_latest_version_cached(repo_path: str, timeout: float = 10) -> Optional[str]:
+    """Get the latest version, reusing a recent answer for the same repository."""
+    now = time.monotonic()
+    cached = _latest_version_cache.get(repo_path)
+    if cached and now < cached[0]:
+        return cached[1]
+    latest = get_latest_version(repo_path, timeout=timeout)
+    ttl = LATEST_VERSION_TTL if latest else FAILED_LOOKUP_TTL
+    _latest_version_cache[repo_path] = (now + ttl, latest)
+    return latest
@@ -1,18 +1,21 @@
 """All /api/* endpoints for the skill-hub web UI."""
 
 import time
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 from flask import Blueprint, jsonify, request
 
+from skill_hub.models import SkillMetadata
+from skill_hub.utils.yaml_parser import parse_skill_file
 from skill_hub.web.repos import (
     Repo,
-    clone_or_pull,
     delete_repo,
     diagnose_all_repos,
     diagnose_repo,
+    file_stamp,
     get_task,
+    git_pool,
     has_remote_updates,
     load_repos_config,
     pull_latest,
@@ -22,47 +25,59 @@ from skill_hub.web.repos import (
     sync_mapping,
 )
 from skill_hub.web.scheduler import scheduler
-from skill_hub.web.state import install_skill, install_to_one, list_skills, uninstall_skill
+from skill_hub.web.state import find_skill_path, install_skill, install_to_one, list_skills, uninstall_skill
 
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 
 
+# Polled several times a second during a clone; timing them only floods the console
+_UNTIMED_ENDPOINTS = frozenset({"api.get_repo_task"})
+
+
 @api_bp.before_request
 def _api_before_request():
+    if request.endpoint in _UNTIMED_ENDPOINTS:
+        return
     request._start_time = time.time()  # type: ignore[attr-defined]
 
 
 @api_bp.after_request
 def _api_after_request(response):
+    if request.endpoint in _UNTIMED_ENDPOINTS:
+        return response
     duration = (time.time() - request._start_time) * 1000  # type: ignore[attr-defined]
     print(f"  -> {request.method} {request.path} {response.status_code} in {duration:.1f}ms")
     return response
 
 
+def _conditional_json(payload):
+    """jsonify payload with a content ETag; answer 304 if the client's copy is current."""
+    response = jsonify(payload)
+    response.add_etag(weak=True)
+    # Let browsers keep the body but always revalidate it against the ETag.
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
+
+
+def serialize_repo(repo: Repo, has_updates: bool) -> dict:
+    """Build the JSON dict for a repo, resolving its directory only once."""
+    target = repo_dir(repo)
+    return {
+        "url": repo.url,
+        "branch": repo.branch,
+        "name": repo.name,
+        "localPath": str(target),
+        "hasRemoteUpdates": has_updates,
+        "isLocal": repo.is_local,
+        "isCloned": (target / ".git").exists(),
+    }
+
+
 @api_bp.route("/skills", methods=["GET"])
 def get_skills():
     """List all skills with their installation status."""
     skills = list_skills()
-    return jsonify([
-        {
-            "name": s.name,
-            "repoName": s.repo_name,
-            "repoUrl": s.repo_url,
-            "status": s.status,
-            "inClaude": s.in_claude,
-            "inAgents": s.in_agents,
-            "claudeMatchesSource": s.claude_matches_source,
-            "agentsMatchesSource": s.agents_matches_source,
-            "md5Source": s.md5_source,
-            "md5Claude": s.md5_claude,
-            "md5Agents": s.md5_agents,
-            "linkClaude": s.link_claude,
-            "linkAgents": s.link_agents,
-            "path": str(s.path),
-            "conflict": s.conflict,
-        }
-        for s in skills
-    ])
+    return _conditional_json([s.to_dict() for s in skills])
 
 
 @api_bp.route("/skills/<name>/install", methods=["POST"])
@@ -73,12 +88,10 @@ def api_install(name: str):
     if method not in ("copy", "symlink"):
         return jsonify({"error": "method must be 'copy' or 'symlink'"}), 400
 
-    skills = list_skills()
-    skill = next((s for s in skills if s.name == name), None)
-    if not skill:
+    source_path = find_skill_path(name)
+    if source_path is None:
         return jsonify({"error": f"Skill '{name}' not found"}), 404
 
-    source_path = skill.path
     if not source_path.exists():
         return jsonify({"error": f"Source path not found: {source_path}"}), 400
 
@@ -88,25 +101,37 @@ def api_install(name: str):
     return jsonify({"error": msg}), 500
 
 
+# Parsed SKILL.md files keyed by path, stored with the (mtime, size) they were read at
+_skill_md_cache: dict[Path, tuple[tuple[int, int], tuple[SkillMetadata, str]]] = {}
+
+
+def _parse_skill_md(skill_md: Path) -> Optional[tuple[SkillMetadata, str]]:
+    """Parse a SKILL.md file, reusing the previous result while the file is unchanged.
+
+    Returns None if the file doesn't exist; the stat that keys the cache answers that too.
+    """
+    stamp = file_stamp(skill_md)
+    if stamp is None:
+        return None
+    cached = _skill_md_cache.get(skill_md)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    parsed = parse_skill_file(skill_md.read_text(encoding="utf-8"))
+    _skill_md_cache[skill_md] = (stamp, parsed)
+    return parsed
+
+
 @api_bp.route("/skills/<name>/meta", methods=["GET"])
 def api_skill_meta(name: str):
     """Get skill metadata from SKILL.md frontmatter."""
-    from skill_hub.utils.yaml_parser import parse_skill_file
-
-    skills = list_skills()
-    skill = next((s for s in skills if s.name == name), None)
-    if not skill:
+    skill_path = find_skill_path(name)
+    if skill_path is None:
         return jsonify({"error": f"Skill '{name}' not found"}), 404
 
-    skill_md = skill.path / "SKILL.md"
-    if not skill_md.exists():
-        return jsonify({"error": "SKILL.md not found"}), 404
-
     try:
-        content = skill_md.read_text(encoding="utf-8")
-        parsed = parse_skill_file(content)
+        parsed = _parse_skill_md(skill_path / "SKILL.md")
         if parsed is None:
-            return jsonify({"error": "Could not parse SKILL.md"}), 422
+            return jsonify({"error": "SKILL.md not found"}), 404
         metadata, body = parsed
         meta_dict = {
             "name": metadata.name,
@@ -132,12 +157,10 @@ def api_install_to(name: str):
     if method not in ("copy", "symlink"):
         return jsonify({"error": "method must be 'copy' or 'symlink'"}), 400
 
-    skills = list_skills()
-    skill = next((s for s in skills if s.name == name), None)
-    if not skill:
+    source_path = find_skill_path(name)
+    if source_path is None:
         return jsonify({"error": f"Skill '{name}' not found"}), 404
 
-    source_path = skill.path
     if not source_path.exists():
         return jsonify({"error": f"Source path not found: {source_path}"}), 400
 
@@ -162,30 +185,28 @@ def get_repos():
     repos = load_repos_config()
     # Use cached status from scheduler if available, fallback to real-time check
     statuses = scheduler.get_all_statuses()
+    # Cache misses (e.g. before the first scheduled check) are checked concurrently.
+    # Uncloned repos have nothing to fetch yet, and submitting them would only
+    # queue this request behind the scheduler's startup clones.
+    unchecked = [
+        r for r in repos
+        if r.name not in statuses and not r.is_local and (repo_dir(r) / ".git").exists()
+    ]
+    live = dict(zip((r.name for r in unchecked), git_pool.map(_has_updates_or_false, unchecked)))
     results = []
     for r in repos:
         status = statuses.get(r.name)
-        if status:
-            has_updates = status.has_updates
-        elif not r.is_local:
-            # Fallback: real-time check if cache miss
-            try:
-                has_updates = has_remote_updates(r)
-            except Exception:
-                has_updates = False
-        else:
-            has_updates = False
-        target = repo_dir(r)
-        results.append({
-            "url": r.url,
-            "branch": r.branch,
-            "name": r.name,
-            "localPath": str(target),
-            "hasRemoteUpdates": has_updates,
-            "isLocal": r.is_local,
-            "isCloned": target.exists() and (target / ".git").exists(),
-        })
-    return jsonify(results)
+        has_updates = status.has_updates if status else live.get(r.name, False)
+        results.append(serialize_repo(r, has_updates))
+    return _conditional_json(results)
+
+
+def _has_updates_or_false(repo: Repo) -> bool:
+    """Live remote-update check; a failed check counts as no updates."""
+    try:
+        return has_remote_updates(repo)
+    except Exception:
+        return False
 
 
 @api_bp.route("/repos", methods=["POST"])
@@ -264,10 +285,12 @@ def remove_repo(name: str):
 def sync_repos():
     """Manually pull latest for all repos."""
     repos = load_repos_config()
-    results = []
-    for repo in repos:
-        ok, msg = pull_latest(repo)
-        results.append({"url": repo.url, "ok": ok, "message": msg})
+    # Each repo only touches its own clone and mapping file, so pulls can overlap
+    outcomes = list(git_pool.map(pull_latest, repos))
+    results = [
+        {"url": repo.url, "ok": ok, "message": msg}
+        for repo, (ok, msg) in zip(repos, outcomes)
+    ]
     return jsonify({"ok": True, "results": results})
 
 
@@ -275,12 +298,11 @@ def sync_repos():
 def update_status():
     """Check if any repos have remote updates available."""
     repos = load_repos_config()
-    with ThreadPoolExecutor(max_workers=8) as pool:
-        futures = {id(r): pool.submit(has_remote_updates, r) for r in repos}
+    outdated = git_pool.map(has_remote_updates, repos)
     updates = [
         {"url": r.url, "name": r.name}
-        for r in repos
-        if futures[id(r)].result()
+        for r, has_updates in zip(repos, outdated)
+        if has_updates
     ]
     return jsonify({"hasUpdates": len(updates) > 0, "repos": updates})
 
@@ -289,10 +311,10 @@ def update_status():
 def get_version():
     """Return current version, latest version, and update availability."""
     from skill_hub import __version__
-    from skill_hub.version import compare_versions, get_latest_version
+    from skill_hub.version import compare_versions, get_latest_version_cached
 
     current = __version__
-    latest = get_latest_version("wuerping/skill-hub", timeout=5)
+    latest = get_latest_version_cached("wuerping/skill-hub", timeout=5)
 
     skip_file = Path.home() / ".skills_repo" / "skip_update"
     skipped = False
@@ -2,12 +2,18 @@
 import time
 from pathlib import Path
 
-from flask import Flask, render_template
+from flask import Flask, render_template, request
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.serving import WSGIRequestHandler
 
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install "skill-hub[fast]"
+    orjson = None
+
 from skill_hub import __version__
-from skill_hub.web.api import api_bp
-from skill_hub.web.repos import load_repos_config, repo_dir
+from skill_hub.web.api import api_bp, serialize_repo
+from skill_hub.web.repos import load_repos_config
 from skill_hub.web.scheduler import scheduler
 from skill_hub.web.state import list_skills
 
@@ -44,50 +50,60 @@ WSGIRequestHandler.finish = _patched_finish
 WSGIRequestHandler.log_request = _patched_log_request
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson; output is always compact.
+
+    Non-string keys (e.g. ``2024:`` in SKILL.md metadata) are stringified, keys
+    are sorted like DefaultJSONProvider.sort_keys, and
+    dates go through self.default so they format the same as without orjson.
+    Anything orjson can't encode (e.g. ints beyond 64 bits) falls back to json.
+    Parsing stays on json: request bodies are small, and orjson reads big ints
+    as floats.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+
 def create_app() -> Flask:
-    app = Flask(__name__, template_folder=str(Path(__file__).parent / "templates"))
+    templates_dir = Path(__file__).parent / "templates"
+    app = Flask(__name__, template_folder=str(templates_dir))
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
     app.register_blueprint(api_bp)
 
+    @app.after_request
+    def _mark_versioned_static_immutable(response):
+        # Static URLs carry ?v=<version> and never change content, so browsers may
+        # keep them until the next release without revalidating. Unversioned
+        # static URLs keep Flask's default caching.
+        if request.endpoint == "static" and "v" in request.args:
+            response.cache_control.no_cache = None
+            response.cache_control.max_age = 365 * 24 * 3600
+            response.cache_control.immutable = True
+        return response
+
+    # Compile templates up front so the first page load doesn't pay for it
+    for template in templates_dir.glob("*.html"):
+        app.jinja_env.get_template(template.name)
+
     # Start background scheduler for periodic repo sync checks
     if not scheduler.is_running():
         scheduler.start()
 
     @app.route("/")
     def index():
-        skills = list_skills()
         repos = load_repos_config()
+        skills = list_skills(repos)
         initial_data = {
-            "skills": [
-                {
-                    "name": s.name,
-                    "repoName": s.repo_name,
-                    "repoUrl": s.repo_url,
-                    "status": s.status,
-                    "inClaude": s.in_claude,
-                    "inAgents": s.in_agents,
-                    "claudeMatchesSource": s.claude_matches_source,
-                    "agentsMatchesSource": s.agents_matches_source,
-                    "md5Source": s.md5_source,
-                    "md5Claude": s.md5_claude,
-                    "md5Agents": s.md5_agents,
-                    "linkClaude": s.link_claude,
-                    "linkAgents": s.link_agents,
-                    "path": str(s.path),
-                }
-                for s in skills
-            ],
-            "repos": [
-                {
-                    "url": r.url,
-                    "branch": r.branch,
-                    "name": r.name,
-                    "localPath": str(repo_dir(r)),
-                    "hasRemoteUpdates": False,
-                    "isLocal": r.is_local,
-                    "isCloned": repo_dir(r).exists() and (repo_dir(r) / ".git").exists(),
-                }
-                for r in repos
-            ],
+            "skills": [s.to_dict() for s in skills],
+            "repos": [serialize_repo(r, has_updates=False) for r in repos],
         }
         return render_template(
             "index.html",
@@ -1,22 +1,46 @@
 """repos.yaml management and git operations for ~/.skills_repo."""
 
+import os
 import re
 import shutil
 import subprocess
 import threading
 import uuid
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from skill_hub.utils.path_utils import expand_home
+from skill_hub.utils.yaml_parser import safe_load
 
 SKILLS_REPO_ROOT = expand_home("~/.skills_repo")
 REPOS_YAML = SKILLS_REPO_ROOT / "repos.yaml"
 REPOS_DIR = SKILLS_REPO_ROOT / "repos"
 MAPPINGS_DIR = SKILLS_REPO_ROOT / "mappings"
 
+# Shared pool for network-bound git work (fetch/pull/ls-remote). One pool for the
+# whole process caps concurrent git subprocesses no matter how many requests overlap.
+# Jobs run here must not submit to the pool themselves.
+git_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="skill-hub-git")
+
+
+_GITHUB_REPO_RE = re.compile(r"github\.com[/:]([^/]+)/([^/]+?)(?:\.git)?$")
+
+
+@lru_cache(maxsize=1024)
+def _repo_name_from_url(url: str) -> str:
+    """Derive an 'owner/repo' style name from a repo URL or path."""
+    m = _GITHUB_REPO_RE.search(url)
+    if m:
+        return f"{m.group(1)}/{m.group(2)}"
+    parts = url.rstrip("/").split("/")
+    if len(parts) >= 2:
+        return f"{parts[-2]}/{parts[-1]}"
+    return parts[-1] if parts else url
+
 
 @dataclass
 class Repo:
@@ -26,24 +50,19 @@ class Repo:
 
     def __post_init__(self):
         if self.name is None:
-            m = re.search(r"github\.com[/:]([^/]+)/([^/]+?)(?:\.git)?$", self.url)
-            if m:
-                self.name = f"{m.group(1)}/{m.group(2)}"
-            else:
-                parts = self.url.rstrip("/").split("/")
-                if len(parts) >= 2:
-                    self.name = f"{parts[-2]}/{parts[-1]}"
-                else:
-                    self.name = parts[-1] if parts else self.url
+            self.name = _repo_name_from_url(self.url)
 
     @property
     def dir_name(self) -> str:
         """Safe directory name for this repo (replacing / with __)."""
         return self.name.replace("/", "__") if self.name else ""
 
-    @property
+    @cached_property
     def is_local(self) -> bool:
-        """Return True if this repo points to a local filesystem path."""
+        """Return True if this repo points to a local filesystem path.
+
+        Cached per instance; repos from load_repos_config() live until repos.yaml changes.
+        """
         url = self.url.strip()
         if url.startswith(("~", "/", ".")):
             return True
@@ -52,12 +71,17 @@ class Repo:
         # Fallback: if it resolves to an existing path, treat as local
         return expand_home(url).exists()
 
+    @cached_property
+    def local_path(self) -> Path:
+        """Resolved filesystem path for a local repo, cached like is_local."""
+        return expand_home(self.url)
+
 
 
 def repo_dir(repo: Repo) -> Path:
     """Return the repo directory. For local repos, returns the local path directly."""
     if repo.is_local:
-        return expand_home(repo.url).resolve()
+        return repo.local_path
     return REPOS_DIR / repo.dir_name
 
 
@@ -66,30 +90,72 @@ def mapping_path(repo: Repo) -> Path:
     return MAPPINGS_DIR / f"{repo.dir_name}.yaml"
 
 
+# Last parsed repos.yaml as (path, (st_mtime_ns, st_size), repos)
+_repos_cache: Optional[tuple[Path, tuple[int, int], list[Repo]]] = None
+_repos_cache_lock = threading.Lock()
+
+
+def file_stamp(path: Path) -> Optional[tuple[int, int]]:
+    """Return (st_mtime_ns, st_size) for path, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def load_repos_config() -> list[Repo]:
-    """Load repos from repos.yaml. Returns empty list if file doesn't exist."""
-    if not REPOS_YAML.exists():
+    """Load repos from repos.yaml. Returns empty list if file doesn't exist.
+
+    The parsed list is reused until the file's mtime or size changes.
+    """
+    global _repos_cache
+    stamp = file_stamp(REPOS_YAML)
+    if stamp is None:
         return []
-    with open(REPOS_YAML) as f:
-        data = yaml.safe_load(f) or {}
-    return [Repo(**r) for r in data.get("repos", [])]
+    with _repos_cache_lock:
+        cached = _repos_cache
+        if cached and cached[0] == REPOS_YAML and cached[1] == stamp:
+            return list(cached[2])
+        with open(REPOS_YAML) as f:
+            data = safe_load(f) or {}
+        repos = [Repo(**r) for r in data.get("repos", [])]
+        _repos_cache = (REPOS_YAML, stamp, repos)
+    return list(repos)
 
 
 def save_repos_config(repos: list[Repo]) -> None:
     """Save repos list to repos.yaml."""
+    global _repos_cache
     SKILLS_REPO_ROOT.mkdir(parents=True, exist_ok=True)
     data = {"repos": [{"url": r.url, "branch": r.branch} for r in repos]}
-    with open(REPOS_YAML, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+    with _repos_cache_lock:
+        with open(REPOS_YAML, "w") as f:
+            yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+        # Drop the cache; the next load re-reads what was actually written
+        _repos_cache = None
+
+
+# Parsed mapping files keyed by path, stored with the (mtime, size) they were read at
+_mapping_cache: dict[Path, tuple[tuple[int, int], dict[str, str]]] = {}
 
 
 def load_skill_mapping(repo: Repo) -> dict[str, str]:
-    """Load skill-name -> relative-path mapping from YAML. Returns empty dict if not exists."""
+    """Load skill-name -> relative-path mapping from YAML. Returns empty dict if not exists.
+
+    The parsed mapping is cached until the file's mtime or size changes.
+    """
     mp = mapping_path(repo)
-    if not mp.exists():
+    stamp = file_stamp(mp)
+    if stamp is None:
         return {}
+    cached = _mapping_cache.get(mp)
+    if cached and cached[0] == stamp:
+        return dict(cached[1])
     with open(mp) as f:
-        return yaml.safe_load(f) or {}
+        mapping = safe_load(f) or {}
+    _mapping_cache[mp] = (stamp, mapping)
+    return dict(mapping)
 
 
 def save_skill_mapping(repo: Repo, mapping: dict[str, str]) -> None:
@@ -98,21 +164,35 @@ def save_skill_mapping(repo: Repo, mapping: dict[str, str]) -> None:
     mp = mapping_path(repo)
     with open(mp, "w") as f:
         yaml.dump(mapping, f, default_flow_style=False, allow_unicode=True)
+    # Refresh the cache directly: coarse mtime clocks may not move on a quick rewrite
+    _mapping_cache[mp] = (file_stamp(mp), dict(mapping))
 
 
-def _find_skills_in_repo(repo_dir: Path) -> tuple[dict[str, str], list[str]]:
-    """Scan a cloned repo for skill directories (contain SKILL.md) and return {name: relative_path}, [conflicts].
+# Directories that never hold skills but can be huge (git objects, dependencies)
+SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv", ".tox"})
 
-    Conflicts occur when multiple SKILL.md files reside in directories with the
-    same name (e.g. repo/a/skill-x/SKILL.md and repo/b/skill-x/SKILL.md).
-    The first discovered path wins; duplicates are reported as conflicts.
+
+def _iter_skill_mds(repo_dir: Path) -> Iterator[Path]:
+    """Yield every SKILL.md file under repo_dir, depth-first in sorted order.
+
+    Sorting makes "first path wins" the same on every filesystem.
+    """
+    for root, dirs, files in os.walk(repo_dir):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        if "SKILL.md" in files:
+            yield Path(root) / "SKILL.md"
+
+
+def _mapping_from_skill_mds(repo_dir: Path, skill_mds: Iterable[Path]) -> tuple[dict[str, str], list[str]]:
+    """Build {name: relative_path}, [conflicts] from SKILL.md paths under repo_dir.
+
+    Pure path work, so callers that already walked the repo (or tests) can pass
+    the files in directly. The first path for a name wins; later ones with the
+    same name are reported as conflicts.
     """
     mapping: dict[str, str] = {}
     conflicts: list[str] = []
-    if not repo_dir.exists():
-        return mapping, conflicts
-
-    for skill_md in repo_dir.rglob("SKILL.md"):
+    for skill_md in skill_mds:
         # skill dir is the parent of SKILL.md
         skill_dir = skill_md.parent
         # skill name = directory name
@@ -132,6 +212,23 @@ def _find_skills_in_repo(repo_dir: Path) -> tuple[dict[str, str], list[str]]:
     return mapping, conflicts
 
 
+def _find_skills_in_repo(repo_dir: Path) -> tuple[dict[str, str], list[str]]:
+    """Scan a cloned repo for skill directories (contain SKILL.md) and return {name: relative_path}, [conflicts].
+
+    Conflicts occur when multiple SKILL.md files reside in directories with the
+    same name (e.g. repo/a/skill-x/SKILL.md and repo/b/skill-x/SKILL.md).
+    The first discovered path wins; duplicates are reported as conflicts.
+    """
+    if not repo_dir.exists():
+        return {}, []
+    return _mapping_from_skill_mds(repo_dir, _iter_skill_mds(repo_dir))
+
+
+def _clone_cmd(url: str, branch: str, target: Path, *extra: str) -> list[str]:
+    """Build a shallow single-branch clone command; only the checked-out tree is scanned."""
+    return ["git", "clone", "--depth", "1", "--branch", branch, *extra, url, str(target)]
+
+
 def sync_mapping(repo: Repo) -> tuple[bool, str]:
     """Clone or update a repo and rebuild its skill mapping. Returns (success, message)."""
     target = repo_dir(repo)
@@ -154,7 +251,7 @@ def sync_mapping(repo: Repo) -> tuple[bool, str]:
 
             try:
                 subprocess.run(
-                    ["git", "clone", "--branch", repo.branch, repo.url, str(target)],
+                    _clone_cmd(repo.url, repo.branch, target),
                     check=True, capture_output=True, text=True, timeout=120,
                 )
             except subprocess.CalledProcessError as e:
@@ -193,7 +290,7 @@ def clone_or_pull(repo: Repo) -> tuple[bool, str]:
     if not target.exists():
         try:
             subprocess.run(
-                ["git", "clone", "--branch", repo.branch, repo.url, str(target)],
+                _clone_cmd(repo.url, repo.branch, target),
                 check=True, capture_output=True, text=True, timeout=120,
             )
             return True, f"Cloned {repo.url}"
@@ -258,6 +355,7 @@ def delete_repo(repo: Repo) -> tuple[bool, str]:
     mp = mapping_path(repo)
     if mp.exists():
         mp.unlink()
+    _mapping_cache.pop(mp, None)
     repos = load_repos_config()
     repos = [r for r in repos if r.url != repo.url]
     save_repos_config(repos)
@@ -378,7 +476,7 @@ def diagnose_repo(repo: Repo) -> dict:
     })
 
     # Check 5: SKILL.md files exist
-    skill_mds = list(target.rglob("SKILL.md"))
+    skill_mds = list(_iter_skill_mds(target))
     skill_count = len(skill_mds)
     report["checks"].append({
         "name": "skill_md_files",
@@ -412,8 +510,8 @@ def diagnose_repo(repo: Repo) -> dict:
         if skill_count_in_mapping > 0:
             report["checks"][-1]["skills"] = list(mapping.keys())[:10]
 
-    # Check 8: Scan for skills
-    mapping_scanned, conflicts = _find_skills_in_repo(target)
+    # Check 8: Scan for skills (reusing the SKILL.md files found in check 5)
+    mapping_scanned, conflicts = _mapping_from_skill_mds(target, skill_mds)
     report["checks"].append({
         "name": "skill_scan",
         "ok": len(mapping_scanned) > 0,
@@ -423,22 +521,21 @@ def diagnose_repo(repo: Repo) -> dict:
         report["checks"][-1]["conflicts"] = conflicts
 
     # Overall status
-    all_ok = all(c["ok"] for c in report["checks"])
-    report["overall_ok"] = all_ok
+    failed_checks = [c["name"] for c in report["checks"] if not c["ok"]]
+    report["overall_ok"] = not failed_checks
 
-    if all_ok:
+    if not failed_checks:
         report["summary"] = f"All checks passed. Found {len(mapping_scanned)} skill(s)."
     else:
-        failed_checks = [c["name"] for c in report["checks"] if not c["ok"]]
         report["summary"] = f"Failed checks: {', '.join(failed_checks)}"
 
     return report
 
 
 def diagnose_all_repos() -> list[dict]:
-    """Run diagnostics on all configured repos."""
+    """Run diagnostics on all configured repos (concurrently, in config order)."""
     repos = load_repos_config()
-    return [diagnose_repo(repo) for repo in repos]
+    return list(git_pool.map(diagnose_repo, repos))
 
 
 # ---------------------------------------------------------------------------
@@ -478,10 +575,16 @@ def get_task(task_id: str) -> Optional[RepoTask]:
         return _tasks.get(task_id)
 
 
+# "Receiving objects:  45% (123/270)" etc.
+_CLONE_PROGRESS_RE = re.compile(
+    r"(Receiving objects|Resolving deltas|remote: Counting objects|remote: Compressing objects):\s+(\d+)%"
+)
+_CLONING_INTO_RE = re.compile(r"Cloning into '(.+)'")
+
+
 def _parse_clone_progress(line: str) -> Optional[tuple[int, str]]:
     """Parse git clone --progress stderr line. Returns (percent, step) or None."""
-    # "Receiving objects:  45% (123/270)" etc.
-    m = re.search(r"(Receiving objects|Resolving deltas|remote: Counting objects|remote: Compressing objects):\s+(\d+)%", line)
+    m = _CLONE_PROGRESS_RE.search(line)
     if m:
         stage = m.group(1)
         pct = int(m.group(2))
@@ -491,7 +594,7 @@ def _parse_clone_progress(line: str) -> Optional[tuple[int, str]]:
         elif "Resolving" in stage:
             return 70 + int(pct * 0.25), f"{stage}: {pct}%"
     # "Cloning into '...'"
-    m2 = re.search(r"Cloning into '(.+)'", line)
+    m2 = _CLONING_INTO_RE.search(line)
     if m2:
         return 5, f"Cloning into '{m2.group(1)}'"
     return None
@@ -525,7 +628,7 @@ def _run_task(task: RepoTask):
             task.progress = 5
 
             proc = subprocess.Popen(
-                ["git", "clone", "--branch", task.branch, "--progress", task.url, str(target)],
+                _clone_cmd(task.url, task.branch, target, "--progress"),
                 stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
             )
             # Read stderr line by line for progress
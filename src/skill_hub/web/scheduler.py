@@ -3,11 +3,11 @@
 import json
 import threading
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from skill_hub.web.repos import load_repos_config, has_remote_updates, sync_mapping, repo_dir, Repo
+from skill_hub.web.repos import load_repos_config, has_remote_updates, sync_mapping, repo_dir, Repo, git_pool
 
 SETTINGS_FILE = Path.home() / ".skills_repo" / "settings.json"
 DEFAULT_SCAN_INTERVAL_MINUTES = 30
@@ -20,6 +20,26 @@ class RepoStatus:
     error: Optional[str] = None
 
 
+def _check_repo(repo: Repo) -> RepoStatus:
+    """Check one repo for remote updates, cloning it first if needed."""
+    if repo.is_local:
+        return RepoStatus(has_updates=False, last_checked=time.time())
+    # A .git entry implies the directory exists, so one probe answers both
+    if not (repo_dir(repo) / ".git").exists():
+        # Repo not cloned yet or directory is invalid — clone it now
+        try:
+            ok, msg = sync_mapping(repo)
+        except Exception as e:
+            return RepoStatus(has_updates=False, last_checked=time.time(), error=str(e))
+        return RepoStatus(has_updates=False, last_checked=time.time(), error=None if ok else msg)
+    # Repo exists and is a valid git repo — check for remote updates
+    try:
+        has_updates = has_remote_updates(repo)
+    except Exception as e:
+        return RepoStatus(has_updates=False, last_checked=time.time(), error=str(e))
+    return RepoStatus(has_updates=has_updates, last_checked=time.time())
+
+
 class RepoScheduler:
     """Singleton scheduler that periodically checks remote repos for updates."""
 
@@ -86,51 +106,9 @@ class RepoScheduler:
     def check_now(self) -> None:
         """Run a single check cycle immediately. Clone uncloned repos first."""
         repos = load_repos_config()
-        new_status: dict[str, RepoStatus] = {}
-        for repo in repos:
-            if repo.is_local:
-                new_status[repo.name] = RepoStatus(
-                    has_updates=False,
-                    last_checked=time.time(),
-                )
-                continue
-            target = repo_dir(repo)
-            is_valid_git = target.exists() and (target / ".git").exists()
-            if not target.exists() or not is_valid_git:
-                # Repo not cloned yet or directory is invalid — clone it now
-                try:
-                    ok, msg = sync_mapping(repo)
-                    if ok:
-                        new_status[repo.name] = RepoStatus(
-                            has_updates=False,
-                            last_checked=time.time(),
-                        )
-                    else:
-                        new_status[repo.name] = RepoStatus(
-                            has_updates=False,
-                            last_checked=time.time(),
-                            error=msg,
-                        )
-                except Exception as e:
-                    new_status[repo.name] = RepoStatus(
-                        has_updates=False,
-                        last_checked=time.time(),
-                        error=str(e),
-                    )
-                continue
-            # Repo exists and is a valid git repo — check for remote updates
-            try:
-                has_updates = has_remote_updates(repo)
-                new_status[repo.name] = RepoStatus(
-                    has_updates=has_updates,
-                    last_checked=time.time(),
-                )
-            except Exception as e:
-                new_status[repo.name] = RepoStatus(
-                    has_updates=False,
-                    last_checked=time.time(),
-                    error=str(e),
-                )
+        # Repos are independent, so their clones and remote checks can overlap
+        statuses = git_pool.map(_check_repo, repos)
+        new_status = {repo.name: status for repo, status in zip(repos, statuses)}
         with self._cache_lock:
             self._status_cache = new_status
 
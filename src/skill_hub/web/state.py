@@ -1,16 +1,21 @@
 """Skills state tracking — listing, status computation, install/uninstall."""
 
+import filecmp
 import hashlib
 import json
 import os
 import shutil
-from concurrent.futures import ThreadPoolExecutor
+import stat
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 from skill_hub.web.repos import (
-    REPOS_DIR,
+    SKIP_DIRS,
+    Repo,
     _find_skills_in_repo,
+    git_pool,
     load_repos_config,
     load_skill_mapping,
     mapping_path,
@@ -62,6 +67,30 @@ def _dir_mtime(path: Path) -> float:
         pass
     return latest
 
+
+def _tree_dir_mtime(path: Path) -> float:
+    """Return the latest mtime of path and its subdirectories.
+
+    Adding, removing or renaming an entry bumps its parent directory's mtime,
+    so this notices new or deleted skills without a stat() per file.
+    """
+    latest = 0.0
+    try:
+        latest = path.stat().st_mtime
+        for root, dirs, _files in os.walk(path):
+            # Same pruning as skill discovery; git activity must not force a rescan
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for d in dirs:
+                try:
+                    mtime = os.stat(os.path.join(root, d)).st_mtime
+                    if mtime > latest:
+                        latest = mtime
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return latest
+
 CLAUDE_SKILLS = Path.home() / ".claude" / "skills"
 AGENTS_SKILLS = Path.home() / ".agents" / "skills"
 
@@ -99,6 +128,25 @@ class SkillEntry:
             return "outdated"
         return "not_installed"
 
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "repoName": self.repo_name,
+            "repoUrl": self.repo_url,
+            "status": self.status,
+            "inClaude": self.in_claude,
+            "inAgents": self.in_agents,
+            "claudeMatchesSource": self.claude_matches_source,
+            "agentsMatchesSource": self.agents_matches_source,
+            "md5Source": self.md5_source,
+            "md5Claude": self.md5_claude,
+            "md5Agents": self.md5_agents,
+            "linkClaude": self.link_claude,
+            "linkAgents": self.link_agents,
+            "path": str(self.path),
+            "conflict": self.conflict,
+        }
+
 
 def _md5_of_dir(path: Path) -> str:
     """Return a combined MD5 of all files in a directory (sorted by path).
@@ -112,84 +160,145 @@ def _md5_of_dir(path: Path) -> str:
     cached = _md5_cache.get(cache_key)
     if cached and cached[0] >= mtime:
         return cached[1]
+    # Walk with plain strings instead of a Path per file. Sorting on the
+    # relative path parts keeps the order sorted(path.rglob("*")) gave, so
+    # persisted hashes stay valid.
+    root_str = os.fspath(path)
+    files: list[tuple[tuple[str, ...], str]] = []
+    for root, _dirs, names in os.walk(root_str):
+        rel = os.path.relpath(root, root_str)
+        prefix = () if rel == "." else tuple(rel.split(os.sep))
+        for name in names:
+            files.append((prefix + (name,), os.path.join(root, name)))
+    files.sort()
     h = hashlib.md5()
-    for f in sorted(path.rglob("*")):
-        if f.is_file():
-            h.update(f.name.encode())
-            h.update(f.read_bytes())
+    # Stream through one reusable buffer rather than reading each file whole
+    buf = bytearray(1 << 16)
+    view = memoryview(buf)
+    for parts, file_path in files:
+        try:
+            fh = open(file_path, "rb")
+        except FileNotFoundError:
+            continue  # dangling symlink
+        with fh:
+            h.update(parts[-1].encode())
+            while n := fh.readinto(buf):
+                h.update(view[:n])
     result = h.hexdigest()
     _md5_cache[cache_key] = (mtime, result)
     _save_md5_cache()
     return result
 
 
-def _is_skill_dir(path: Path) -> bool:
-    """A skill directory is any subdirectory that is not hidden."""
-    return path.is_dir() and not path.name.startswith(".")
+def _scan_install_dir(install_dir: Path, pool: ThreadPoolExecutor) -> dict[str, tuple[Future, bool]]:
+    """Scan an install directory and return {name: (md5 future, is_symlink)}.
 
-
-def _scan_install_dir(install_dir: Path) -> dict[str, tuple[str, bool]]:
-    """Scan an install directory and return {name: (md5, is_symlink)}."""
-    result: dict[str, tuple[str, bool]] = {}
-    if install_dir.exists():
-        for entry in install_dir.iterdir():
-            if _is_skill_dir(entry):
-                result[entry.name] = (_md5_of_dir(entry), entry.is_symlink())
+    A skill directory is any subdirectory that is not hidden. MD5s are computed
+    on pool so callers can overlap them with other work.
+    """
+    result: dict[str, tuple[Future, bool]] = {}
+    try:
+        it = os.scandir(install_dir)
+    except OSError:
+        return result
+    with it:
+        for entry in it:
+            # DirEntry answers type checks from the directory listing itself,
+            # so plain skill dirs cost no extra stat() calls
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            result[entry.name] = (pool.submit(_md5_of_dir, Path(entry.path)), entry.is_symlink())
     return result
 
 
-def list_skills() -> list[SkillEntry]:
-    """Scan repos via skill mappings and both install directories, return all skills with status."""
-    repos = load_repos_config()
-
-    claude_skills = _scan_install_dir(CLAUDE_SKILLS)
-    agents_skills = _scan_install_dir(AGENTS_SKILLS)
+def _repo_skill_paths(repo: Repo) -> list[tuple[Repo, str, Path]]:
+    """Resolve one repo's skill mapping to (repo, skill_name, skill_path) entries."""
+    mapping = load_skill_mapping(repo)
+    target = repo_dir(repo)
 
-    # Gather all skill paths first
+    if repo.is_local and target.exists():
+        # Local repo: rebuild mapping if the directory has changed since the
+        # mapping file was last written so that newly-added skills show up
+        # immediately without requiring a manual sync.
+        repo_mtime = _tree_dir_mtime(target)
+        try:
+            stale = not mapping or repo_mtime > mapping_path(repo).stat().st_mtime
+        except OSError:
+            stale = True  # mapping file missing
+        if stale:
+            mapping, _conflicts = _find_skills_in_repo(target)
+            if mapping:
+                save_skill_mapping(repo, mapping)
+
+    if not mapping:
+        # Mapping empty — try to sync (clone + scan) for non-local repos. The
+        # clone runs on the shared git pool so git subprocesses stay capped
+        # however many listings overlap.
+        if not repo.is_local:
+            try:
+                ok, _msg = git_pool.submit(sync_mapping, repo).result()
+                if ok:
+                    mapping = load_skill_mapping(repo)
+            except Exception:
+                pass
+        if not mapping:
+            return []
     entries: list[tuple[Repo, str, Path]] = []
-    for repo in repos:
-        mapping = load_skill_mapping(repo)
-        target = repo_dir(repo)
-
-        if repo.is_local and target.exists():
-            # Local repo: rebuild mapping if the directory has changed since the
-            # mapping file was last written so that newly-added skills show up
-            # immediately without requiring a manual sync.
-            mp = mapping_path(repo)
-            repo_mtime = _dir_mtime(target)
-            if not mapping or not mp.exists() or repo_mtime > mp.stat().st_mtime:
-                mapping, _conflicts = _find_skills_in_repo(target)
-                if mapping:
-                    save_skill_mapping(repo, mapping)
+    for skill_name, rel_path in mapping.items():
+        skill_path = target / rel_path
+        if skill_path.exists():
+            entries.append((repo, skill_name, skill_path))
+    return entries
+
+
+def _gather_skill_paths(
+    repos: list[Repo], pool: Optional[ThreadPoolExecutor] = None
+) -> list[tuple[Repo, str, Path]]:
+    """Resolve every repo's skill mapping, in repos.yaml order.
+
+    Repos are independent, so with a pool they are resolved side by side;
+    map() keeps the output order stable. The caller's pool only does disk work
+    (mapping loads, tree walks, rescans) so it doesn't queue behind fetches;
+    first-time clones are handed to the shared git pool.
+    """
+    if pool is None or len(repos) < 2:
+        return [entry for repo in repos for entry in _repo_skill_paths(repo)]
+    return [entry for entries in pool.map(_repo_skill_paths, repos) for entry in entries]
+
+
+def find_skill_path(name: str) -> Optional[Path]:
+    """Return the source path list_skills() would report for name, or None.
+
+    Only the repo mappings are consulted, so no skill directory is hashed.
+    """
+    for _repo, skill_name, skill_path in _gather_skill_paths(load_repos_config()):
+        if skill_name == name:
+            return skill_path
+    return None
+
+
+def list_skills(repos: Optional[list[Repo]] = None) -> list[SkillEntry]:
+    """Scan repos via skill mappings and both install directories, return all skills with status.
+
+    Callers that already loaded repos.yaml can pass the list to skip reloading it.
+    """
+    if repos is None:
+        repos = load_repos_config()
 
-        if not mapping:
-            # Mapping empty — try to sync (clone + scan) for non-local repos
-            if not repo.is_local:
-                try:
-                    ok, _msg = sync_mapping(repo)
-                    if ok:
-                        mapping = load_skill_mapping(repo)
-                except Exception:
-                    pass
-            if not mapping:
-                continue
-        repo_root = repo_dir(repo)
-        for skill_name, rel_path in mapping.items():
-            skill_path = repo_root / rel_path
-            if skill_path.exists():
-                entries.append((repo, skill_name, skill_path))
-
-    # Detect cross-repo name conflicts
-    name_counts: dict[str, int] = {}
-    for _repo, skill_name, _skill_path in entries:
-        name_counts[skill_name] = name_counts.get(skill_name, 0) + 1
-
-    # Parallel MD5 for source skills (the dominant cost)
     with ThreadPoolExecutor(max_workers=8) as pool:
-        md5_futures = {
-            (repo.name, skill_name): pool.submit(_md5_of_dir, skill_path)
-            for repo, skill_name, skill_path in entries
-        }
+        # Installed copies are hashed while the repo mappings are gathered
+        claude_skills = _scan_install_dir(CLAUDE_SKILLS, pool)
+        agents_skills = _scan_install_dir(AGENTS_SKILLS, pool)
+
+        entries = _gather_skill_paths(repos, pool)
+
+        # Parallel MD5 for source skills (the dominant cost); names are counted
+        # in the same pass to detect cross-repo conflicts
+        md5_futures: dict[tuple[str, str], Future] = {}
+        name_counts: dict[str, int] = {}
+        for repo, skill_name, skill_path in entries:
+            md5_futures[(repo.name, skill_name)] = pool.submit(_md5_of_dir, skill_path)
+            name_counts[skill_name] = name_counts.get(skill_name, 0) + 1
 
     skills: list[SkillEntry] = []
     for repo, skill_name, skill_path in entries:
@@ -197,8 +306,10 @@ def list_skills() -> list[SkillEntry]:
         in_a = skill_name in agents_skills
         source_md5 = md5_futures[(repo.name, skill_name)].result()
 
-        c_md5, c_link = claude_skills.get(skill_name, ("", False))
-        a_md5, a_link = agents_skills.get(skill_name, ("", False))
+        c_future, c_link = claude_skills.get(skill_name, (None, False))
+        a_future, a_link = agents_skills.get(skill_name, (None, False))
+        c_md5 = c_future.result() if c_future else ""
+        a_md5 = a_future.result() if a_future else ""
 
         skills.append(SkillEntry(
             name=skill_name,
@@ -220,11 +331,14 @@ def list_skills() -> list[SkillEntry]:
 
 def _remove_destination(dest: Path) -> None:
     """Safely remove an existing installation destination."""
-    if not dest.exists() and not dest.is_symlink():
+    # One lstat() tells missing, symlink (even dangling) and directory apart
+    try:
+        mode = dest.lstat().st_mode
+    except FileNotFoundError:
         return
-    if dest.is_symlink():
+    if stat.S_ISLNK(mode):
         dest.unlink()
-    elif dest.is_dir():
+    elif stat.S_ISDIR(mode):
         shutil.rmtree(dest)
 
 
@@ -237,6 +351,48 @@ def _try_symlink(source: Path, dest: Path) -> bool:
         return False
 
 
+def _tree_listing(path: Path) -> tuple[list[str], list[str]]:
+    """Return sorted relative (dirs, files) under path, following links as copytree does."""
+    dirs: list[str] = []
+    files: list[str] = []
+    for root, subdirs, names in os.walk(path, followlinks=True):
+        rel = os.path.relpath(root, path)
+        prefix = "" if rel == "." else rel + os.sep
+        dirs.extend(prefix + d for d in subdirs)
+        files.extend(prefix + n for n in names)
+    return sorted(dirs), sorted(files)
+
+
+def _same_tree(a: Path, b: Path) -> bool:
+    """Return True if a and b hold the same relative paths with identical file bytes.
+
+    Walked fresh instead of going through the md5 cache: cached hashes miss
+    nested deletions and ignore which subdirectory a file sits in.
+    """
+    a_dirs, a_files = _tree_listing(a)
+    b_dirs, b_files = _tree_listing(b)
+    if a_dirs != b_dirs or a_files != b_files:
+        return False
+    _match, mismatch, errors = filecmp.cmpfiles(a, b, a_files, shallow=False)
+    return not mismatch and not errors
+
+
+def _copy_install(source_path: Path, dest: Path) -> None:
+    """Copy source_path to dest, leaving an existing identical copy in place."""
+    # Either side may have changed in ways the cached hashes miss (a nested
+    # deletion), so both are rehashed on the next listing
+    _md5_cache.pop(str(source_path.resolve()), None)
+    if not dest.is_symlink() and dest.is_dir():
+        _md5_cache.pop(str(dest.resolve()), None)
+        if _same_tree(source_path, dest):
+            return
+    _remove_destination(dest)
+    # copytree keeps the source mtimes, which may be older than the cached
+    # entry for the previous copy, so that entry must not be trusted
+    _md5_cache.pop(str(dest.resolve()), None)
+    shutil.copytree(source_path, dest)
+
+
 def install_skill(name: str, source_path: Path, method: str = "copy") -> tuple[bool, str]:
     """Install skill from source_path to both ~/.claude/skills/ and ~/.agents/skills/."""
     try:
@@ -246,10 +402,9 @@ def install_skill(name: str, source_path: Path, method: str = "copy") -> tuple[b
         dest_a = CLAUDE_SKILLS / name
         dest_b = AGENTS_SKILLS / name
 
-        _remove_destination(dest_a)
-        _remove_destination(dest_b)
-
         if method == "symlink":
+            _remove_destination(dest_a)
+            _remove_destination(dest_b)
             ok_a = _try_symlink(source_path, dest_a)
             ok_b = _try_symlink(source_path, dest_b)
             if ok_a and ok_b:
@@ -257,12 +412,12 @@ def install_skill(name: str, source_path: Path, method: str = "copy") -> tuple[b
             # Fallback to copy if symlink failed on either side
             _remove_destination(dest_a)
             _remove_destination(dest_b)
-            shutil.copytree(source_path, dest_a)
-            shutil.copytree(source_path, dest_b)
+            _copy_install(source_path, dest_a)
+            _copy_install(source_path, dest_b)
             return True, f"Installed {name} to both directories (copy fallback — symlink not supported)"
 
-        shutil.copytree(source_path, dest_a)
-        shutil.copytree(source_path, dest_b)
+        _copy_install(source_path, dest_a)
+        _copy_install(source_path, dest_b)
         return True, f"Installed {name} to both directories"
     except Exception as e:
         return False, str(e)
@@ -280,16 +435,16 @@ def install_to_one(name: str, source_path: Path, target: str, method: str = "cop
 
         dest_dir.mkdir(parents=True, exist_ok=True)
         dest = dest_dir / name
-        _remove_destination(dest)
 
         if method == "symlink":
+            _remove_destination(dest)
             if _try_symlink(source_path, dest):
                 return True, f"Installed {name} to {target} (symlink)"
             _remove_destination(dest)
-            shutil.copytree(source_path, dest)
+            _copy_install(source_path, dest)
             return True, f"Installed {name} to {target} (copy fallback — symlink not supported)"
 
-        shutil.copytree(source_path, dest)
+        _copy_install(source_path, dest)
         return True, f"Installed {name} to {target}"
     except Exception as e:
         return False, str(e)
@@ -95,6 +95,44 @@ class TestRepoScheduler:
         assert "test/repo" in statuses
         assert statuses["test/repo"].has_updates is False
 
+    def test_check_now_records_each_repo(self, fresh_scheduler, tmp_path, monkeypatch):
+        # Repos are checked concurrently; each still gets its own status
+        from skill_hub.web.repos import Repo
+        repos = [
+            Repo(url="https://github.com/first/repo", branch="main"),
+            Repo(url="https://github.com/second/repo", branch="main"),
+        ]
+        monkeypatch.setattr(
+            'skill_hub.web.scheduler.load_repos_config',
+            lambda: repos
+        )
+        fake_repo_dir = tmp_path / "repos" / "test__repo"
+        fake_repo_dir.mkdir(parents=True)
+        (fake_repo_dir / ".git").mkdir()
+        monkeypatch.setattr(
+            'skill_hub.web.scheduler.repo_dir',
+            lambda repo: fake_repo_dir
+        )
+
+        def fake_has_remote_updates(repo):
+            if repo.name == "second/repo":
+                raise RuntimeError("ls-remote failed")
+            return True
+
+        monkeypatch.setattr(
+            'skill_hub.web.scheduler.has_remote_updates',
+            fake_has_remote_updates
+        )
+
+        fresh_scheduler.check_now()
+
+        first = fresh_scheduler.get_status("first/repo")
+        second = fresh_scheduler.get_status("second/repo")
+        assert first.has_updates is True
+        assert first.error is None
+        assert second.has_updates is False
+        assert second.error == "ls-remote failed"
+
     def test_settings_persistence(self, fresh_scheduler, tmp_path, monkeypatch):
         # Use temp settings file
         settings_file = tmp_path / "settings.json"
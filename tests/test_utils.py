@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 from skill_hub.utils.path_utils import expand_home
-from skill_hub.utils.yaml_parser import SkillParseError, parse_skill_file
+from skill_hub.utils.yaml_parser import SkillParseError, parse_skill_file, safe_load
 
 
 class TestExpandHome:
@@ -91,3 +91,19 @@ metadata:
 """
         metadata, body = parse_skill_file(content)
         assert metadata.metadata == {"version": "1.2.3"}
+
+
+class TestSafeLoad:
+    """Tests for the safe_load helper."""
+
+    def test_matches_pyyaml_safe_load(self):
+        import yaml
+
+        doc = "name: x\nmetadata:\n  tags: [a, b]\n  version: 1.2.3\nfolded: >\n  two\n  lines\n"
+        assert safe_load(doc) == yaml.safe_load(doc)
+
+    def test_rejects_python_tags(self):
+        import yaml
+
+        with pytest.raises(yaml.YAMLError):
+            safe_load("!!python/object/apply:os.getcwd []")
@@ -11,15 +11,16 @@ from skill_hub.web.repos import Repo
 
 
 @pytest.fixture
-def temp_home(tmp_path):
+def temp_home(tmp_path, monkeypatch):
     """Create a temp home directory with fake skills dirs."""
     # New structure: repos/ is the full git clone, mappings/ tracks skill locations
-    repo_clone = tmp_path / "skills_repo" / "repos" / "example__repo"
+    hub = tmp_path / "skills_repo"
+    repo_clone = hub / "repos" / "example__repo"
     repo_clone.mkdir(parents=True)
     (repo_clone / "test-skill").mkdir()
     (repo_clone / "test-skill" / "SKILL.md").write_text("---\nname: test-skill\ndescription: Test\n---\n\nTest body")
 
-    mapping_file = tmp_path / "skills_repo" / "mappings" / "example__repo.yaml"
+    mapping_file = hub / "mappings" / "example__repo.yaml"
     mapping_file.parent.mkdir(parents=True, exist_ok=True)
     mapping_file.write_text("test-skill: test-skill\n")
 
@@ -28,38 +29,52 @@ def temp_home(tmp_path):
     claude.mkdir(parents=True)
     agents.mkdir(parents=True)
 
-    repos_yaml = tmp_path / "skills_repo" / "repos.yaml"
+    repos_yaml = hub / "repos.yaml"
     repos_yaml.write_text("repos:\n  - url: https://github.com/example/repo\n    branch: main\n")
 
-    import skill_hub.web.repos
-    import skill_hub.web.state
-    skill_hub.web.repos.SKILLS_REPO_ROOT = tmp_path / "skills_repo"
-    skill_hub.web.repos.REPOS_YAML = repos_yaml
-    skill_hub.web.repos.REPOS_DIR = tmp_path / "skills_repo" / "repos"
-    skill_hub.web.repos.MAPPINGS_DIR = tmp_path / "skills_repo" / "mappings"
+    # monkeypatch restores every module global after the test
+    import skill_hub.web.repos as repos_module
+    import skill_hub.web.scheduler as scheduler_module
     import skill_hub.web.state as state_module
-    state_module.REPOS_DIR = tmp_path / "skills_repo" / "repos"
-    skill_hub.web.state.CLAUDE_SKILLS = claude
-    skill_hub.web.state.AGENTS_SKILLS = agents
+    monkeypatch.setattr(repos_module, "SKILLS_REPO_ROOT", hub)
+    monkeypatch.setattr(repos_module, "REPOS_YAML", repos_yaml)
+    monkeypatch.setattr(repos_module, "REPOS_DIR", hub / "repos")
+    monkeypatch.setattr(repos_module, "MAPPINGS_DIR", hub / "mappings")
+    monkeypatch.setattr(state_module, "CLAUDE_SKILLS", claude)
+    monkeypatch.setattr(state_module, "AGENTS_SKILLS", agents)
+    monkeypatch.setattr(state_module, "MD5_CACHE_FILE", hub / "md5_cache.json")
+    monkeypatch.setattr(scheduler_module, "SETTINGS_FILE", hub / "settings.json")
 
     yield tmp_path, claude, agents
 
-    # Reset module state
-    skill_hub.web.repos.SKILLS_REPO_ROOT = skill_hub.web.repos.SKILLS_REPO_ROOT
-    skill_hub.web.repos.REPOS_YAML = skill_hub.web.repos.REPOS_YAML
-    skill_hub.web.repos.REPOS_DIR = skill_hub.web.repos.REPOS_DIR
-    skill_hub.web.repos.MAPPINGS_DIR = skill_hub.web.repos.MAPPINGS_DIR
-    state_module.REPOS_DIR = skill_hub.web.repos.REPOS_DIR
 
+@pytest.fixture(scope="module")
+def app():
+    # Paths are read from module globals per request, so one app serves every temp_home.
+    # The app is built before any temp_home patch applies, so the background scheduler
+    # is kept off; its first check would otherwise read the real ~/.skills_repo.
+    from skill_hub.web.scheduler import scheduler
 
-@pytest.fixture
-def client(temp_home):
-    app = create_app()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(scheduler, "start", lambda: None)
+        app = create_app()
     app.config["TESTING"] = True
+    return app
+
+
+@pytest.fixture
+def client(app, temp_home):
     with app.test_client() as c:
         yield c
 
 
+def test_shared_app_does_not_start_scheduler(app):
+    """The module-wide app must not run a check cycle against the real home."""
+    from skill_hub.web.scheduler import scheduler
+
+    assert not scheduler.is_running()
+
+
 def test_get_skills_returns_list(client, temp_home):
     resp = client.get("/api/skills")
     assert resp.status_code == 200
@@ -70,6 +85,57 @@ def test_get_skills_returns_list(client, temp_home):
     assert data[0]["status"] == "not_installed"
 
 
+def test_get_skills_not_modified_with_etag(client, temp_home):
+    resp = client.get("/api/skills")
+    etag = resp.headers.get("ETag")
+    assert etag
+
+    resp = client.get("/api/skills", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.data == b""
+
+    # Installing changes the payload, so the old ETag no longer matches
+    client.post("/api/skills/test-skill/install")
+    resp = client.get("/api/skills", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers.get("ETag") != etag
+
+
+def test_static_assets_are_versioned_and_cacheable(client, temp_home):
+    from skill_hub import __version__
+
+    page = client.get("/").get_data(as_text=True)
+    assert f"/static/style.css?v={__version__}" in page
+
+    resp = client.get(f"/static/style.css?v={__version__}")
+    assert resp.status_code == 200
+    assert "max-age=31536000" in resp.headers["Cache-Control"]
+    assert "immutable" in resp.headers["Cache-Control"]
+
+    resp = client.get(
+        f"/static/style.css?v={__version__}",
+        headers={"If-None-Match": resp.headers["ETag"]},
+    )
+    assert resp.status_code == 304
+
+    resp = client.get("/static/style.css")
+    assert resp.status_code == 200
+    assert "max-age=31536000" not in resp.headers.get("Cache-Control", "")
+    assert "immutable" not in resp.headers.get("Cache-Control", "")
+
+
+def test_skill_meta_reflects_file_edits(client, temp_home):
+    tmp_path, _claude, _agents = temp_home
+    resp = client.get("/api/skills/test-skill/meta")
+    assert resp.status_code == 200
+    assert resp.get_json()["meta"]["description"] == "Test"
+
+    skill_md = tmp_path / "skills_repo" / "repos" / "example__repo" / "test-skill" / "SKILL.md"
+    skill_md.write_text("---\nname: test-skill\ndescription: Edited\n---\n\nTest body")
+    resp = client.get("/api/skills/test-skill/meta")
+    assert resp.get_json()["meta"]["description"] == "Edited"
+
+
 def test_install_skill(client, temp_home):
     tmp_path, claude, agents = temp_home
     name = "test-skill"
@@ -166,6 +232,15 @@ class TestRepoLocalDetection:
         repo = Repo(url="my-skill")
         assert repo.name == "my-skill"
 
+    def test_local_repo_dir_is_resolved_once(self, tmp_path):
+        from skill_hub.web.repos import repo_dir
+
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        repo = Repo(url=str(tmp_path / "link"))
+        assert repo_dir(repo) == (tmp_path / "real").resolve()
+        assert repo_dir(repo) is repo_dir(repo)
+
 
 def test_sync_repos_returns_results(client, temp_home):
     resp = client.post("/api/repos/sync")
@@ -206,6 +281,27 @@ def test_add_local_repo_path(client, temp_home):
     assert "my-skill" in skill_names
 
 
+def test_local_repo_picks_up_new_nested_skill(client, temp_home):
+    """A skill added deep inside a local repo is listed without a manual sync."""
+    import time
+
+    tmp_path, _claude, _agents = temp_home
+    local_repo = tmp_path / "local_skills"
+    (local_repo / "group" / "first-skill").mkdir(parents=True)
+    (local_repo / "group" / "first-skill" / "SKILL.md").write_text("---\nname: first-skill\n---\n")
+    client.post("/api/repos", json={"url": str(local_repo)}, content_type="application/json")
+
+    new_skill = local_repo / "group" / "second-skill"
+    new_skill.mkdir()
+    (new_skill / "SKILL.md").write_text("---\nname: second-skill\n---\n")
+    later = time.time() + 5
+    os.utime(new_skill.parent, (later, later))
+
+    names = [s["name"] for s in client.get("/api/skills").get_json()]
+    assert "first-skill" in names
+    assert "second-skill" in names
+
+
 def test_delete_local_repo_does_not_remove_source(client, temp_home):
     """Deleting a local repo should only remove the mapping, not the source directory."""
     tmp_path, claude, agents = temp_home
@@ -378,6 +474,94 @@ class TestSymlinkInstall:
         assert (agents / name).is_symlink()
 
 
+def test_remove_destination_handles_each_kind(tmp_path):
+    from skill_hub.web.state import _remove_destination
+
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "f").write_text("x")
+    (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+    for name in ("dir", "dangling", "never-existed"):
+        _remove_destination(tmp_path / name)
+        assert not os.path.lexists(tmp_path / name)
+
+
+class TestCopyInstall:
+    """Copy installs skip destinations that already match the source."""
+
+    def test_identical_copy_is_kept(self, client, temp_home, monkeypatch):
+        import shutil
+
+        client.post("/api/skills/test-skill/install", json={"method": "copy"})
+
+        copies = []
+        real_copytree = shutil.copytree
+        monkeypatch.setattr(shutil, "copytree", lambda *a, **kw: copies.append(a) or real_copytree(*a, **kw))
+        resp = client.post("/api/skills/test-skill/install", json={"method": "copy"})
+        assert resp.status_code == 200
+        assert copies == []
+
+    def test_changed_source_is_recopied(self, client, temp_home):
+        import time
+
+        tmp_path, claude, agents = temp_home
+        client.post("/api/skills/test-skill/install", json={"method": "copy"})
+
+        source_md = tmp_path / "skills_repo" / "repos" / "example__repo" / "test-skill" / "SKILL.md"
+        source_md.write_text("---\nname: test-skill\ndescription: Changed\n---\n")
+        later = time.time() + 5
+        os.utime(source_md, (later, later))
+
+        resp = client.post("/api/skills/test-skill/install-to", json={"target": "claude"})
+        assert resp.status_code == 200
+        assert "Changed" in (claude / "test-skill" / "SKILL.md").read_text()
+        assert "Changed" not in (agents / "test-skill" / "SKILL.md").read_text()
+
+
+    def test_damaged_nested_copy_is_repaired(self, client, temp_home):
+        tmp_path, claude, _agents = temp_home
+        source = tmp_path / "skills_repo" / "repos" / "example__repo" / "test-skill"
+        (source / "refs").mkdir()
+        (source / "refs" / "a.md").write_text("reference")
+        client.post("/api/skills/test-skill/install", json={"method": "copy"})
+        client.get("/api/skills")  # caches the installed copy's hash
+
+        (claude / "test-skill" / "refs" / "a.md").unlink()
+
+        resp = client.post("/api/skills/test-skill/install-to", json={"target": "claude"})
+        assert resp.status_code == 200
+        assert (claude / "test-skill" / "refs" / "a.md").read_text() == "reference"
+
+
+    def test_nested_deletion_in_source_is_recopied(self, client, temp_home):
+        tmp_path, claude, _agents = temp_home
+        source = tmp_path / "skills_repo" / "repos" / "example__repo" / "test-skill"
+        (source / "refs").mkdir()
+        (source / "refs" / "a.md").write_text("a")
+        (source / "refs" / "b.md").write_text("b")
+        client.post("/api/skills/test-skill/install", json={"method": "copy"})
+        client.get("/api/skills")  # caches both hashes
+
+        (source / "refs" / "b.md").unlink()
+
+        resp = client.post("/api/skills/test-skill/install-to", json={"target": "claude"})
+        assert resp.status_code == 200
+        assert not (claude / "test-skill" / "refs" / "b.md").exists()
+
+    def test_file_moved_between_dirs_is_recopied(self, client, temp_home):
+        tmp_path, claude, _agents = temp_home
+        source = tmp_path / "skills_repo" / "repos" / "example__repo" / "test-skill"
+        (source / "refs").mkdir()
+        (source / "refs" / "a.md").write_text("a")
+        client.post("/api/skills/test-skill/install", json={"method": "copy"})
+
+        (source / "refs" / "a.md").rename(source / "a.md")
+
+        resp = client.post("/api/skills/test-skill/install-to", json={"target": "claude"})
+        assert resp.status_code == 200
+        assert (claude / "test-skill" / "a.md").read_text() == "a"
+        assert not (claude / "test-skill" / "refs" / "a.md").exists()
+
+
 class TestNameConflictProtection:
     """Tests for name conflict detection and protection."""
 
@@ -397,6 +581,31 @@ class TestNameConflictProtection:
         assert len(conflicts) == 1
         assert "conflicts with existing" in conflicts[0]
 
+    def test_discovery_skips_dot_git_and_dependencies(self, tmp_path):
+        from skill_hub.web.repos import _find_skills_in_repo
+
+        repo = tmp_path / "repo"
+        for rel in (".git/skill-a", "node_modules/pkg/skill-b", ".claude/skills/skill-c"):
+            (repo / rel).mkdir(parents=True)
+            (repo / rel / "SKILL.md").write_text("---\nname: x\n---")
+
+        mapping, conflicts = _find_skills_in_repo(repo)
+        assert mapping == {"skill-c": str(Path(".claude") / "skills" / "skill-c")}
+        assert conflicts == []
+
+    def test_mapping_from_skill_mds_needs_no_files(self):
+        """The mapping builder works on paths alone, in the order given."""
+        from skill_hub.web.repos import _mapping_from_skill_mds
+
+        repo = Path("/nonexistent/repo")
+        mapping, conflicts = _mapping_from_skill_mds(repo, [
+            repo / "b" / "skill-x" / "SKILL.md",
+            repo / "skill-y" / "SKILL.md",
+            repo / "a" / "skill-x" / "SKILL.md",
+        ])
+        assert mapping == {"skill-x": str(Path("b") / "skill-x"), "skill-y": "skill-y"}
+        assert len(conflicts) == 1
+
     def test_cross_repo_conflict_flagged_in_list(self, client, temp_home):
         """When two repos provide the same skill name, list_skills marks conflict=True."""
         tmp_path, _claude, _agents = temp_home
@@ -467,3 +676,266 @@ class TestSettingsAPI:
         assert resp.status_code == 400
         data = resp.get_json()
         assert 'error' in data
+
+
+def test_skill_lookup_does_not_hash_directories(client, temp_home, monkeypatch):
+    """Single-skill endpoints find the skill from the mappings alone."""
+    import skill_hub.web.state as state_module
+
+    def fail(_path):
+        raise AssertionError("skill directories should not be hashed")
+
+    monkeypatch.setattr(state_module, "_md5_of_dir", fail)
+    assert client.get("/api/skills/test-skill/meta").status_code == 200
+    assert client.get("/api/skills/missing/meta").status_code == 404
+
+
+def test_skill_meta_missing_skill_md(client, temp_home):
+    tmp_path, _claude, _agents = temp_home
+    (tmp_path / "skills_repo" / "repos" / "example__repo" / "test-skill" / "SKILL.md").unlink()
+    resp = client.get("/api/skills/test-skill/meta")
+    assert resp.status_code == 404
+    assert resp.get_json()["error"] == "SKILL.md not found"
+
+
+def test_diagnose_repo_walks_skills_once(temp_home, monkeypatch):
+    import skill_hub.web.repos as repos_module
+
+    tmp_path, _claude, _agents = temp_home
+    local_repo = tmp_path / "local_skills"
+    for rel in ("a/skill-x", "b/skill-x", "skill-y"):
+        (local_repo / rel).mkdir(parents=True)
+        (local_repo / rel / "SKILL.md").write_text("---\nname: x\n---\n")
+
+    walks = []
+    real_iter = repos_module._iter_skill_mds
+
+    def counting_iter(repo_dir):
+        walks.append(repo_dir)
+        return real_iter(repo_dir)
+
+    monkeypatch.setattr(repos_module, "_iter_skill_mds", counting_iter)
+    report = repos_module.diagnose_repo(Repo(url=str(local_repo)))
+    checks = {c["name"]: c for c in report["checks"]}
+    assert checks["skill_md_files"]["message"] == "Found 3 SKILL.md file(s)"
+    assert checks["skill_scan"]["message"] == "Scan found 2 skill(s)"
+    assert len(checks["skill_scan"]["conflicts"]) == 1
+    assert len(walks) == 1
+
+
+def test_diagnose_all_repos_keeps_config_order(temp_home, monkeypatch):
+    """Repos are diagnosed concurrently but reported in repos.yaml order."""
+    import time
+
+    import skill_hub.web.repos as repos_module
+
+    tmp_path, _claude, _agents = temp_home
+    (tmp_path / "skills_repo" / "repos.yaml").write_text(
+        "repos:\n"
+        "  - url: https://github.com/first/repo\n    branch: main\n"
+        "  - url: https://github.com/second/repo\n    branch: main\n"
+    )
+
+    def fake_diagnose(repo):
+        # The first repo finishes last
+        time.sleep(0.05 if repo.name == "first/repo" else 0)
+        return {"repo_name": repo.name}
+
+    monkeypatch.setattr(repos_module, "diagnose_repo", fake_diagnose)
+    reports = repos_module.diagnose_all_repos()
+    assert [r["repo_name"] for r in reports] == ["first/repo", "second/repo"]
+
+
+def test_get_repos_checks_unknown_repos_concurrently(client, temp_home, monkeypatch):
+    """Repos the scheduler hasn't seen yet are checked live, all at once."""
+    import threading
+
+    import skill_hub.web.api as api_module
+
+    tmp_path, _claude, _agents = temp_home
+    (tmp_path / "skills_repo" / "repos.yaml").write_text(
+        "repos:\n"
+        "  - url: https://github.com/first/repo\n    branch: main\n"
+        "  - url: https://github.com/second/repo\n    branch: main\n"
+    )
+    for dir_name in ("first__repo", "second__repo"):
+        (tmp_path / "skills_repo" / "repos" / dir_name / ".git").mkdir(parents=True)
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fake_has_remote_updates(repo):
+        both_started.wait()  # times out unless both checks run at once
+        if repo.name == "second/repo":
+            raise RuntimeError("ls-remote failed")
+        return True
+
+    monkeypatch.setattr(api_module.scheduler, "get_all_statuses", lambda: {})
+    monkeypatch.setattr(api_module, "has_remote_updates", fake_has_remote_updates)
+    repos = {r["name"]: r for r in client.get("/api/repos").get_json()}
+    assert repos["first/repo"]["hasRemoteUpdates"] is True
+    assert repos["second/repo"]["hasRemoteUpdates"] is False
+
+
+def test_get_repos_skips_live_check_for_uncloned_repos(client, temp_home, monkeypatch):
+    """An uncloned repo has nothing to fetch, so it never waits on the git pool."""
+    import skill_hub.web.api as api_module
+
+    checked = []
+    monkeypatch.setattr(api_module.scheduler, "get_all_statuses", lambda: {})
+    monkeypatch.setattr(api_module, "has_remote_updates", lambda repo: checked.append(repo.name) or True)
+    repos = client.get("/api/repos").get_json()
+    assert [r["hasRemoteUpdates"] for r in repos] == [False]
+    assert checked == []
+
+
+def test_gather_skill_paths_resolves_repos_concurrently(temp_home, monkeypatch):
+    """Repo mappings are resolved side by side, yet entries keep repos.yaml order."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    import skill_hub.web.state as state_module
+
+    both_started = threading.Barrier(2, timeout=5)
+    real_load = state_module.load_skill_mapping
+
+    def fake_load(repo):
+        both_started.wait()  # times out unless both repos are resolved at once
+        return real_load(repo)
+
+    monkeypatch.setattr(state_module, "load_skill_mapping", fake_load)
+    monkeypatch.setattr(state_module, "sync_mapping", lambda repo: (False, "offline"))
+    repos = [Repo(url="https://github.com/example/repo"), Repo(url="https://github.com/other/repo")]
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        entries = state_module._gather_skill_paths(repos, pool)
+    assert [(r.name, name) for r, name, _path in entries] == [("example/repo", "test-skill")]
+
+
+def test_gather_skill_paths_clones_on_git_pool(temp_home, monkeypatch):
+    """A repo with no mapping yet is cloned on the shared git pool, not the caller's."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    import skill_hub.web.state as state_module
+
+    threads = []
+    monkeypatch.setattr(
+        state_module, "sync_mapping",
+        lambda repo: threads.append(threading.current_thread().name) or (False, "offline"),
+    )
+    repos = [Repo(url="https://github.com/example/repo"), Repo(url="https://github.com/other/repo")]
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        state_module._gather_skill_paths(repos, pool)
+    assert len(threads) == 1 and threads[0].startswith("skill-hub-git")
+
+
+def test_load_skill_mapping_cache_tracks_size(temp_home):
+    """A rewrite within the same mtime tick is still picked up by its size change."""
+    from skill_hub.web.repos import load_skill_mapping, mapping_path
+
+    repo = Repo(url="https://github.com/example/repo")
+    assert load_skill_mapping(repo) == {"test-skill": "test-skill"}
+
+    mp = mapping_path(repo)
+    st = mp.stat()
+    mp.write_text("test-skill: test-skill\nother-skill: nested/other-skill\n")
+    os.utime(mp, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert load_skill_mapping(repo) == {"test-skill": "test-skill", "other-skill": "nested/other-skill"}
+
+
+def test_load_repos_config_cache_tracks_file(temp_home):
+    """Cached repos are reused until repos.yaml changes, and callers get their own list."""
+    from skill_hub.web.repos import load_repos_config
+
+    tmp_path, _claude, _agents = temp_home
+    repos = load_repos_config()
+    assert [r.name for r in repos] == ["example/repo"]
+    repos.append(Repo(url="https://github.com/not/saved"))
+    assert len(load_repos_config()) == 1
+
+    (tmp_path / "skills_repo" / "repos.yaml").write_text(
+        "repos:\n"
+        "  - url: https://github.com/example/repo\n    branch: main\n"
+        "  - url: https://github.com/second/repo\n    branch: main\n"
+    )
+    assert [r.name for r in load_repos_config()] == ["example/repo", "second/repo"]
+
+
+def test_json_provider_uses_orjson_when_installed(client):
+    pytest.importorskip("orjson")
+    from skill_hub.web.app import OrjsonProvider
+
+    assert isinstance(client.application.json, OrjsonProvider)
+    resp = client.get("/api/settings")
+    assert resp.is_json
+    assert "scanIntervalMinutes" in resp.get_json()
+
+
+def test_orjson_provider_matches_stdlib_output(client, temp_home):
+    pytest.importorskip("orjson")
+    from flask.json.provider import DefaultJSONProvider
+
+    tmp_path, _claude, _agents = temp_home
+    skill_md = tmp_path / "skills_repo" / "repos" / "example__repo" / "test-skill" / "SKILL.md"
+    skill_md.write_text(
+        "---\nname: test-skill\ndescription: Test\nmetadata:\n  2024: release\n  released: 2024-05-01\n---\n"
+    )
+    meta = client.get("/api/skills/test-skill/meta").get_json()["meta"]
+    assert meta["2024"] == "release"
+    assert meta["released"] == "Wed, 01 May 2024 00:00:00 GMT"
+
+    skill_md.write_text("---\nname: test-skill\ndescription: Test\nmetadata:\n  big: 123456789012345678901234567890\n---\n")
+    resp = client.get("/api/skills/test-skill/meta")
+    assert resp.status_code == 200
+    assert resp.get_json()["meta"]["big"] == 123456789012345678901234567890
+
+    import datetime
+    stdlib = DefaultJSONProvider(client.application)
+    for obj in ({"b": 1, "a": 2}, {"d": datetime.date(2024, 5, 1)}, {"n": 2**70}):
+        assert client.application.json.loads(client.application.json.dumps(obj)) == stdlib.loads(stdlib.dumps(obj))
+
+
+class TestCloneProgressParsing:
+    """Unit tests for _parse_clone_progress."""
+
+    def test_receiving_objects(self):
+        from skill_hub.web.repos import _parse_clone_progress
+        assert _parse_clone_progress("Receiving objects:  50% (5/10)") == (35, "Receiving objects: 50%")
+
+    def test_resolving_deltas(self):
+        from skill_hub.web.repos import _parse_clone_progress
+        assert _parse_clone_progress("Resolving deltas: 100% (3/3), done.") == (95, "Resolving deltas: 100%")
+
+    def test_cloning_into(self):
+        from skill_hub.web.repos import _parse_clone_progress
+        assert _parse_clone_progress("Cloning into '/tmp/x'...") == (5, "Cloning into '/tmp/x'")
+
+    def test_unrelated_line(self):
+        from skill_hub.web.repos import _parse_clone_progress
+        assert _parse_clone_progress("warning: redirecting") is None
+
+
+def test_clone_cmd_is_shallow():
+    from skill_hub.web.repos import _clone_cmd
+
+    cmd = _clone_cmd("https://github.com/a/b", "dev", Path("/tmp/b"), "--progress")
+    assert cmd[:6] == ["git", "clone", "--depth", "1", "--branch", "dev"]
+    assert "--progress" in cmd
+    assert cmd[-2:] == ["https://github.com/a/b", "/tmp/b"]
+
+
+def test_version_lookup_is_cached(client, monkeypatch):
+    import skill_hub.version as version_module
+
+    calls = []
+
+    def fake_latest(repo_path, timeout=10):
+        calls.append(repo_path)
+        return "99.0.0"
+
+    monkeypatch.setattr(version_module, "get_latest_version", fake_latest)
+    monkeypatch.setattr(version_module, "_latest_version_cache", {})
+
+    for _ in range(3):
+        data = client.get("/api/version").get_json()
+        assert data["latest"] == "99.0.0"
+        assert data["hasUpdate"] is True
+    assert len(calls) == 1